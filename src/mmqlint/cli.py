@@ -1,50 +1,146 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple, List
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
 from .profiles import load_profiles, Profile
-from .core import (
-    Issue,
-    lint_jsonl,
-    fix_jsonl,
-    verify_system_visibility_jsonl,
-    check_dataset_on_disk,
-    should_fail,
-)
+
+if TYPE_CHECKING:
+    from .core import Issue
+
+# Subcommands import their .core entry points locally so that e.g. `--help`
+# and `list-profiles` don't pay for modules they never use.
 
 app = typer.Typer(add_completion=False)
 console = Console()
 
 
-def _print_issues(title: str, issues: List[Issue]) -> None:
+_ISSUE_FIELDS = ("level", "code", "line", "sample_id", "path", "message")
+_ISSUE_GET = attrgetter(*_ISSUE_FIELDS)
+_PROFILE_COLUMNS = ("name", "require_system", "system_visible", "fold_system_into_user", "system_invisible_level")
+
+
+def _flush(*renderables) -> None:
+    # Render into one buffer and write it out once; per-row console output dominates on big reports.
+    with console.capture() as cap:
+        for r in renderables:
+            console.print(r)
+    sys.stdout.write(cap.get())
+
+
+# TSV cells must stay on one row and in one column: spell out tabs and line breaks.
+_TSV_ESCAPES = str.maketrans({"\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _tsv_row(cells: Sequence[str]) -> str:
+    return "\t".join(c.translate(_TSV_ESCAPES) for c in cells) + "\n"
+
+
+def _render_table(
+    title: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[str]],
+    column_opts: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> None:
+    """Print a table; when stdout is not a terminal (CI, pipes) skip Rich and write plain TSV once."""
+    if not console.is_terminal:
+        sys.stdout.write(title + "\n" + _tsv_row(columns) + "".join(_tsv_row(r) for r in rows))
+        return
     table = Table(title=title)
-    table.add_column("level", style="bold")
-    table.add_column("code")
-    table.add_column("line", justify="right")
-    table.add_column("sample_id")
-    table.add_column("path")
-    table.add_column("message")
+    for c in columns:
+        table.add_column(c, **(column_opts or {}).get(c, {}))
+    for r in rows:
+        table.add_row(*r)
+    _flush(table)
 
-    for it in issues[:2000]:
-        table.add_row(it.level, it.code, str(it.line), it.sample_id, it.path, it.message)
 
-    console.print(table)
+def _profile_rows(profs: Sequence[Tuple[str, Profile]]) -> List[Tuple[str, ...]]:
+    return [(p.name, str(p.require_system), str(p.system_visible), str(p.fold_system_into_user), p.system_invisible_level) for _, p in profs]
+
+
+def _print_issues(title: str, issues: List[Issue], max_display: int = 2000) -> None:
+    rows = [(it.level, it.code, str(it.line), it.sample_id, it.path, it.message) for it in islice(issues, max_display)]
+    _render_table(
+        title,
+        ("level", "code", "line", "sample_id", "path", "message"),
+        rows,
+        {"level": {"style": "bold"}, "line": {"justify": "right"}},
+    )
     console.print(f"[bold]Total issues:[/bold] {len(issues)}")
 
 
+def _dumps(obj, indent: bool = False) -> bytes:
+    # orjson (optional) is much faster than stdlib json and emits bytes directly.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _issue_dict(i: Issue) -> Dict[str, Any]:
+    # attrgetter reads all fields in C; doesn't rely on Issue having a __dict__
+    return dict(zip(_ISSUE_FIELDS, _ISSUE_GET(i)))
+
+
+def _dump_issues(path: str, issues: List[Issue]) -> None:
+    """Stream issues to a report file, one object at a time.
+
+    - *.jsonl: one issue object per line.
+    - anything else: a JSON array with one issue per line.
+    """
+    with open(path, "wb") as f:
+        if path.endswith(".jsonl"):
+            for i in issues:
+                f.write(_dumps(_issue_dict(i)))
+                f.write(b"\n")
+            return
+        f.write(b"[")
+        for n, i in enumerate(issues):
+            f.write(b",\n  " if n else b"\n  ")
+            f.write(_dumps(_issue_dict(i)))
+        f.write(b"\n]\n" if issues else b"]\n")
+
+
+@lru_cache(maxsize=100)
+def _load_profiles_cached(path: Optional[str], mtime_ns: int, size: int) -> Dict[str, Profile]:
+    return load_profiles(path)
+
+
+def _load_profiles(profile_file: Optional[str]) -> Dict[str, Profile]:
+    # Memoize on (abs path, mtime, size) so repeated entry (e.g. CLI invoked from a test runner)
+    # skips the YAML re-parse; any edit to the file changes the key.
+    # Profiles are frozen, so a shallow copy of the registry is enough to isolate callers.
+    if not profile_file:
+        return dict(_load_profiles_cached(None, 0, 0))
+    st = os.stat(profile_file)
+    return dict(_load_profiles_cached(os.path.abspath(profile_file), st.st_mtime_ns, st.st_size))
+
+
+_SIZE_RE = re.compile(r"^\s*(\d+)\s*[x,]\s*(\d+)\s*$", re.IGNORECASE)
+
+
 def _parse_expect_size(s: str) -> Tuple[int, int]:
     # "512,512" or "512x512"
-    s = s.strip().lower().replace("x", ",")
-    parts = [p.strip() for p in s.split(",") if p.strip()]
-    if len(parts) != 2:
+    m = _SIZE_RE.match(s)
+    if not m:
         raise typer.BadParameter("expect-size must be like 512,512 or 512x512")
-    return int(parts[0]), int(parts[1])
+    return int(m.group(1)), int(m.group(2))
 
 
 @app.command("init-profiles")
@@ -71,7 +167,9 @@ def _to_yaml(obj) -> str:
         import yaml  # type: ignore
     except Exception:
         raise RuntimeError("PyYAML required for YAML output. `pip install pyyaml`")
-    return yaml.safe_dump(obj, sort_keys=False)
+    # libyaml-backed dumper when available; same output as safe_dump.
+    Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(obj, Dumper=Dumper, sort_keys=False)
 
 
 @app.command("validate-profiles")
@@ -80,23 +178,15 @@ def validate_profiles(
     format: str = typer.Option("table", "--format", help="table|json"),
 ) -> None:
     """Load and validate profiles (CI-friendly)."""
-    profs = load_profiles(profile_file)
+    profs = _load_profiles(profile_file)
     if format.lower() == "json":
-        console.print(json.dumps({k: vars(v) for k, v in profs.items()}, indent=2))
+        # Raw write: machine-readable output shouldn't go through Rich's highlighting.
+        sys.stdout.write(_dumps({k: v.__dict__ for k, v in profs.items()}, indent=True).decode("utf-8") + "\n")
         raise typer.Exit(code=0)
 
-    table = Table(title="Active profile registry (merged)")
-    table.add_column("name")
-    table.add_column("require_system")
-    table.add_column("system_visible")
-    table.add_column("fold_system_into_user")
-    table.add_column("system_invisible_level")
-
-    for name in sorted(profs.keys()):
-        p = profs[name]
-        table.add_row(p.name, str(p.require_system), str(p.system_visible), str(p.fold_system_into_user), p.system_invisible_level)
-    console.print(f"OK: loaded {len([k for k in profs.keys() if k not in ('__meta__',)])} profile(s) from {profile_file}")
-    console.print(table)
+    items = sorted((k, v) for k, v in profs.items() if k != "__meta__")
+    console.print(f"OK: loaded {len(items)} profile(s) from {profile_file}")
+    _render_table("Active profile registry (merged)", _PROFILE_COLUMNS, _profile_rows(items))
 
 
 @app.command("list-profiles")
@@ -104,34 +194,29 @@ def list_profiles(
     profile_file: Optional[str] = typer.Option(None, "--profile-file", help="Optional JSON/YAML file to load/override profiles."),
 ) -> None:
     """List available profiles."""
-    profs = load_profiles(profile_file)
-    table = Table(title="mmqlint profiles")
-    table.add_column("name")
-    table.add_column("require_system")
-    table.add_column("system_visible")
-    table.add_column("fold_system_into_user")
-    table.add_column("system_invisible_level")
-    for name in sorted(profs.keys()):
-        p = profs[name]
-        table.add_row(p.name, str(p.require_system), str(p.system_visible), str(p.fold_system_into_user), p.system_invisible_level)
-    console.print(table)
+    profs = _load_profiles(profile_file)
+    _render_table("mmqlint profiles", _PROFILE_COLUMNS, _profile_rows(sorted(profs.items())))
 
 
 @app.command("check")
 def check(
     data: str = typer.Argument(..., help="Path to JSONL file."),
-    report: Optional[str] = typer.Option(None, "--report", help="Write issues to JSON file."),
+    report: Optional[str] = typer.Option(None, "--report", help="Write issues to JSON file (.jsonl: one issue per line)."),
     mode: str = typer.Option("train", "--mode", help="train | infer"),
     profile: str = typer.Option("generic", "--profile", help="Profile name (see list-profiles)."),
     profile_file: Optional[str] = typer.Option(None, "--profile-file", help="Load/override profiles from a JSON/YAML file."),
     strict_typed: bool = typer.Option(False, "--strict-typed", help="Require content to be a list of typed items (no raw strings)."),
     fix: bool = typer.Option(False, "--fix/--no-fix", help="Apply safe auto-fixes and write to --out."),
     out: Optional[str] = typer.Option(None, "--out", help="Output JSONL path (required if --fix)."),
-    fix_report: Optional[str] = typer.Option(None, "--fix-report", help="Write applied fixes to JSON file."),
+    fix_report: Optional[str] = typer.Option(None, "--fix-report", help="Write applied fixes to JSON file (.jsonl: one fix per line)."),
     summary: bool = typer.Option(True, "--summary/--no-summary", help="Print summary statistics."),
     fail_on: str = typer.Option("ERROR", "--fail-on", help="Exit non-zero if any issue is >= this level (WARN|ERROR)."),
+    max_display: int = typer.Option(2000, "--max-display", min=0, help="Max issues shown in the table (the report always has all)."),
+    workers: int = typer.Option(1, "--workers", min=0, help="Lint with N processes (0 = one per CPU)."),
 ) -> None:
-    profs = load_profiles(profile_file)
+    from .core import lint_jsonl, lint_jsonl_parallel, fix_jsonl
+
+    profs = _load_profiles(profile_file)
     if profile not in profs:
         raise typer.BadParameter(f"Unknown profile: {profile}. Use `mmqlint list-profiles`.")
     profile_obj = profs[profile]
@@ -143,42 +228,58 @@ def check(
             raise typer.BadParameter("--out is required when --fix")
         target_path, applied_fixes = fix_jsonl(data, out, strict_typed=strict_typed)
         if fix_report:
-            Path(fix_report).write_text(json.dumps([vars(x) for x in applied_fixes], indent=2), encoding="utf-8")
+            _dump_issues(fix_report, applied_fixes)
+
+    if workers == 1:
+        issues = lint_jsonl(target_path, mode=mode, profile_obj=profile_obj, strict_typed=strict_typed)
+    else:
+        issues = lint_jsonl_parallel(target_path, workers=workers or None, mode=mode, profile_obj=profile_obj, strict_typed=strict_typed)
+
+    _print_issues(f"mmqlint: {target_path} (mode={mode}, profile={profile}, strict_typed={strict_typed})", issues, max_display)
 
-    issues = lint_jsonl(target_path, mode=mode, profile_obj=profile_obj, strict_typed=strict_typed)
+    _finalize(issues, report=report, summary=summary, fail_on=fail_on)
 
-    _print_issues(f"mmqlint: {target_path} (mode={mode}, profile={profile}, strict_typed={strict_typed})", issues)
+
+def _finalize(issues: List[Issue], *, report: Optional[str], summary: bool, fail_on: str) -> None:
+    """Write the report, print the summary and exit; with a summary, issue levels are counted once for both."""
+    from .core import should_fail, should_fail_from_counts
 
     if report:
-        Path(report).write_text(json.dumps([vars(x) for x in issues], indent=2), encoding="utf-8")
+        _dump_issues(report, issues)
 
     if summary:
-        _print_summary(issues)
-
-    if should_fail(issues, fail_on):
+        # single pass over issues for both tallies
+        by_level: Counter = Counter()
+        by_code: Counter = Counter()
+        for i in issues:
+            by_level[i.level] += 1
+            by_code[i.code] += 1
+        _print_summary(by_level, by_code)
+        failed = should_fail_from_counts(by_level, fail_on)
+    else:
+        # no tallies needed; stop at the first issue at or above fail_on
+        failed = should_fail(issues, fail_on)
+
+    if failed:
         raise typer.Exit(code=1)
     raise typer.Exit(code=0)
 
 
-def _print_summary(issues: List[Issue]) -> None:
+def _print_summary(by_level: Counter, by_code: Counter) -> None:
     # summary by level and by code (top 10)
-    from collections import Counter
-    by_level = Counter([i.level for i in issues])
-    by_code = Counter([i.code for i in issues])
-    table = Table(title="Summary by level")
-    table.add_column("level")
-    table.add_column("count", justify="right")
-    for k in ["ERROR", "WARN", "INFO"]:
-        if k in by_level:
-            table.add_row(k, str(by_level[k]))
-    console.print(table)
-
-    table2 = Table(title="Top issue codes")
-    table2.add_column("code")
-    table2.add_column("count", justify="right")
-    for code, cnt in by_code.most_common(10):
-        table2.add_row(code, str(cnt))
-    console.print(table2)
+    count_opts = {"count": {"justify": "right"}}
+    _render_table(
+        "Summary by level",
+        ("level", "count"),
+        [(k, str(by_level[k])) for k in ["ERROR", "WARN", "INFO"] if k in by_level],
+        count_opts,
+    )
+    _render_table(
+        "Top issue codes",
+        ("code", "count"),
+        [(code, str(cnt)) for code, cnt in by_code.most_common(10)],
+        count_opts,
+    )
 
 
 @app.command("verify-system")
@@ -189,9 +290,12 @@ def verify_system(
     render_plugin: str = typer.Option(..., "--render-plugin", help="Python file with render(messages, **kwargs)->str."),
     strict_typed: bool = typer.Option(False, "--strict-typed", help="Parse content as typed items (same semantics as check)."),
     fail_on: str = typer.Option("ERROR", "--fail-on", help="Exit non-zero if any issue is >= this level (WARN|ERROR)."),
-    report: Optional[str] = typer.Option(None, "--report", help="Write issues to JSON file."),
+    max_display: int = typer.Option(2000, "--max-display", min=0, help="Max issues shown in the table (the report always has all)."),
+    report: Optional[str] = typer.Option(None, "--report", help="Write issues to JSON file (.jsonl: one issue per line)."),
 ) -> None:
-    profs = load_profiles(profile_file)
+    from .core import verify_system_visibility_jsonl
+
+    profs = _load_profiles(profile_file)
     if profile not in profs:
         raise typer.BadParameter(f"Unknown profile: {profile}. Use `mmqlint list-profiles`.")
     profile_obj = profs[profile]
@@ -202,14 +306,9 @@ def verify_system(
         render_plugin_path=render_plugin,
         strict_typed=strict_typed,
     )
-    _print_issues(f"mmqlint verify-system: {data} (profile={profile})", issues)
-
-    if report:
-        Path(report).write_text(json.dumps([vars(x) for x in issues], indent=2), encoding="utf-8")
+    _print_issues(f"mmqlint verify-system: {data} (profile={profile})", issues, max_display)
 
-    if should_fail(issues, fail_on):
-        raise typer.Exit(code=1)
-    raise typer.Exit(code=0)
+    _finalize(issues, report=report, summary=False, fail_on=fail_on)
 
 
 @app.command("check-dataset")
@@ -220,8 +319,11 @@ def check_dataset(
     coord_field: Optional[str] = typer.Option(None, "--coord-field", help="(Optional) field name for coordinates dict, e.g. coordinates or ann.coords"),
     coord_keys: Optional[str] = typer.Option(None, "--coord-keys", help="(Optional) comma-separated keys within coord-field, e.g. x0,y0,x1,y1"),
     fail_on: str = typer.Option("ERROR", "--fail-on", help="Exit non-zero if any issue is >= this level (WARN|ERROR)."),
-    report: Optional[str] = typer.Option(None, "--report", help="Write issues to JSON file."),
+    max_display: int = typer.Option(2000, "--max-display", min=0, help="Max issues shown in the table (the report always has all)."),
+    report: Optional[str] = typer.Option(None, "--report", help="Write issues to JSON file (.jsonl: one issue per line)."),
 ) -> None:
+    from .core import check_dataset_on_disk
+
     exp = _parse_expect_size(expect_size) if expect_size else None
     keys = [k.strip() for k in coord_keys.split(",")] if coord_keys else None
 
@@ -234,11 +336,6 @@ def check_dataset(
         fail_on_level=fail_on,
     )
 
-    _print_issues(f"mmqlint check-dataset: {dataset_path}", issues)
-
-    if report:
-        Path(report).write_text(json.dumps([vars(x) for x in issues], indent=2), encoding="utf-8")
+    _print_issues(f"mmqlint check-dataset: {dataset_path}", issues, max_display)
 
-    if should_fail(issues, fail_on):
-        raise typer.Exit(code=1)
-    raise typer.Exit(code=0)
+    _finalize(issues, report=report, summary=False, fail_on=fail_on)
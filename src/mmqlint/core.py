@@ -1,22 +1,63 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
+import io
+import os
+import sys
 import json
 import importlib.util
+import inspect
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from .profiles import Profile
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+# JSONL decoding: orjson (C) when installed, stdlib json otherwise. Both accept bytes,
+# so lint and verify-system read input files in binary (no per-line UTF-8 decode into str).
+# orjson rejects NaN/Infinity and turns integers outside 64 bits into floats. Lines it refuses,
+# or where `id` or a `role` (the only values whose repr reaches an issue) decoded to a float,
+# are parsed again by stdlib json so results stay identical.
+_READ_BUFFER = 64 * 1024
+
+
+def _float_id_or_role(obj: Any) -> bool:
+    if type(obj) is not dict:
+        return False
+    if type(obj.get("id")) is float:
+        return True
+    msgs = obj.get("messages")
+    return type(msgs) is list and any(type(m) is dict and type(m.get("role")) is float for m in msgs)
+
+
+def _loads(line: bytes) -> Any:
+    if orjson is not None:
+        try:
+            obj = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not _float_id_or_role(obj):
+                return obj
+    return json.loads(line)
+
 
 # -----------------------------
 # Issue model / severity policy
 # -----------------------------
 _LEVEL_ORDER = {"INFO": 0, "WARN": 1, "ERROR": 2}
 
+# No per-instance __dict__ on 3.10+ (dataclass slots= is unavailable on 3.9); large runs hold millions of issues.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Issue:
     level: str        # INFO|WARN|ERROR
     code: str
@@ -37,11 +78,30 @@ def _issue(level: str, code: str, line: int, sample_id: str, path: str, message:
     return Issue(level=level, code=code, line=line, sample_id=sample_id, path=path, message=message)
 
 
+# Direct constructors for literal levels: skip _issue()'s level validation on the hot path.
+def _err(code: str, line: int, sample_id: str, path: str, message: str) -> Issue:
+    return Issue("ERROR", code, line, sample_id, path, message)
+
+
+def _warn(code: str, line: int, sample_id: str, path: str, message: str) -> Issue:
+    return Issue("WARN", code, line, sample_id, path, message)
+
+
+def _info(code: str, line: int, sample_id: str, path: str, message: str) -> Issue:
+    return Issue("INFO", code, line, sample_id, path, message)
+
+
 def should_fail(issues: List[Issue], fail_on: str) -> bool:
     thr = _LEVEL_ORDER.get((fail_on or "ERROR").upper(), 2)
     return any(_LEVEL_ORDER.get(i.level, 2) >= thr for i in issues)
 
 
+def should_fail_from_counts(by_level: Mapping[str, int], fail_on: str) -> bool:
+    """Same as should_fail, but from precomputed per-level issue counts."""
+    thr = _LEVEL_ORDER.get((fail_on or "ERROR").upper(), 2)
+    return any(n and _LEVEL_ORDER.get(lvl, 2) >= thr for lvl, n in by_level.items())
+
+
 # -----------------------------
 # JSONL chat schema lint
 # -----------------------------
@@ -65,6 +125,12 @@ def _typed_text_of_content(content: Any) -> str:
             return content["text"]
         return ""
     if isinstance(content, list):
+        # common case: a single text item -> return it as-is, no list/join
+        if len(content) == 1:
+            it = content[0]
+            if isinstance(it, dict) and it.get("type") == "text" and isinstance(it.get("text"), str):
+                return it["text"]
+            return ""
         out = []
         for it in content:
             if isinstance(it, dict) and it.get("type") == "text" and isinstance(it.get("text"), str):
@@ -73,48 +139,92 @@ def _typed_text_of_content(content: Any) -> str:
     return ""
 
 
+def _fast_messages_ok(messages: Any, strict_typed: bool) -> bool:
+    """Cheap happy-path check: True only if _validate_messages_schema would report nothing.
+
+    May return False for valid input (e.g. str subclasses); the full validator then decides.
+    """
+    if type(messages) is not list:
+        return False
+    for m in messages:
+        if type(m) is not dict or m.get("role") not in _ALLOWED_ROLES or "content" not in m:
+            return False
+        content = m["content"]
+        if not strict_typed:
+            if type(content) not in (str, list, dict):
+                return False
+            continue
+        if type(content) is not list:
+            return False
+        for it in content:
+            if type(it) is not dict:
+                return False
+            t = it.get("type")
+            if not t:
+                return False
+            if t == "text":
+                if type(it.get("text")) is not str:
+                    return False
+            elif t == "image":
+                if "image" not in it:
+                    return False
+    return True
+
+
+def _msg_path(mi: int, field: Optional[str] = None, ci: Optional[int] = None, sub: Optional[str] = None) -> str:
+    # Issue paths are only formatted when an issue is actually emitted.
+    p = f"messages[{mi}]"
+    if field:
+        p += f".{field}"
+    if ci is not None:
+        p += f"[{ci}]"
+    if sub:
+        p += f".{sub}"
+    return p
+
+
 def _validate_messages_schema(messages: Any, line_no: int, sample_id: str, strict_typed: bool) -> List[Issue]:
+    if _fast_messages_ok(messages, strict_typed):
+        return []
     issues: List[Issue] = []
     if not isinstance(messages, list):
-        return [_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, "messages", "`messages` must be a list.")]
+        return [_err("E003_SCHEMA_MISMATCH", line_no, sample_id, "messages", "`messages` must be a list.")]
 
     for mi, m in enumerate(messages):
-        base = f"messages[{mi}]"
         if not isinstance(m, dict):
-            issues.append(_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, base, "Each message must be an object."))
+            issues.append(_err("E003_SCHEMA_MISMATCH", line_no, sample_id, _msg_path(mi), "Each message must be an object."))
             continue
         role = m.get("role")
         if role not in _ALLOWED_ROLES:
-            issues.append(_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, f"{base}.role", f"Invalid role: {role!r}."))
+            issues.append(_err("E003_SCHEMA_MISMATCH", line_no, sample_id, _msg_path(mi, "role"), f"Invalid role: {role!r}."))
         if "content" not in m:
-            issues.append(_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, f"{base}.content", "Missing required field `content`."))
+            issues.append(_err("E003_SCHEMA_MISMATCH", line_no, sample_id, _msg_path(mi, "content"), "Missing required field `content`."))
             continue
 
         content = m.get("content")
         if strict_typed:
             if not isinstance(content, list):
-                issues.append(_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, f"{base}.content", "With --strict-typed, `content` must be a list of typed items."))
+                issues.append(_err("E003_SCHEMA_MISMATCH", line_no, sample_id, _msg_path(mi, "content"), "With --strict-typed, `content` must be a list of typed items."))
             else:
                 for ci, it in enumerate(content):
-                    p = f"{base}.content[{ci}]"
                     if not isinstance(it, dict):
-                        issues.append(_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, p, "Typed content item must be an object."))
+                        issues.append(_err("E003_SCHEMA_MISMATCH", line_no, sample_id, _msg_path(mi, "content", ci), "Typed content item must be an object."))
                         continue
                     t = it.get("type")
                     if not t:
-                        issues.append(_issue("ERROR", "E003_SCHEMA_MISMATCH", line_no, sample_id, p, "Typed content item missing key `type`."))
+                        issues.append(_err("E003_SCHEMA_MISMATCH", line_no, sample_id, _msg_path(mi, "content", ci), "Typed content item missing key `type`."))
                         continue
                     if t == "text":
                         if not isinstance(it.get("text"), str):
-                            issues.append(_issue("ERROR", "E012_BAD_FIELD_TYPE", line_no, sample_id, f"{p}.text", "type='text' field 'text' must be str."))
+                            issues.append(_err("E012_BAD_FIELD_TYPE", line_no, sample_id, _msg_path(mi, "content", ci, "text"), "type='text' field 'text' must be str."))
                     elif t == "image":
                         if "image" not in it:
-                            issues.append(_issue("ERROR", "E011_MISSING_TYPE_FIELDS", line_no, sample_id, p, "type='image' missing required fields: ['image']"))
+                            issues.append(_err("E011_MISSING_TYPE_FIELDS", line_no, sample_id, _msg_path(mi, "content", ci), "type='image' missing required fields: ['image']"))
                     # Unknown types are allowed for extensibility.
         else:
             # non-strict: allow raw strings or typed list
             if not (isinstance(content, str) or isinstance(content, list) or isinstance(content, dict)):
-                issues.append(_issue("ERROR", "E012_BAD_FIELD_TYPE", line_no, sample_id, f"{base}.content", "content must be str or typed list/object."))
+                issues.append(_err("E012_BAD_FIELD_TYPE", line_no, sample_id, _msg_path(mi, "content"), "content must be str or typed list/object."))
 
     return issues
 
@@ -124,20 +234,20 @@ def _system_presence_and_nonempty(messages: List[Dict[str, Any]], line_no: int,
     if not profile_obj.require_system:
         return issues
 
-    sys_msgs = [m for m in messages if m.get("role") == "system"]
-    if not sys_msgs:
-        issues.append(_issue("ERROR", "E002_SYSTEM_REQUIRED", line_no, sample_id, "messages",
-                             "Profile requires a role='system' message, but none is present."))
-        return issues
-
-    # Must be non-empty
-    for sm in sys_msgs:
-        c = sm.get("content")
-        txt = _typed_text_of_content(c)
-        if _is_blank_text(txt):
-            issues.append(_issue("ERROR", "E002_SYSTEM_EMPTY", line_no, sample_id, "messages",
-                                 "Profile requires a non-empty role='system' message, but system content is empty/blank."))
+    # Must be present, and every system message must be non-empty (single pass)
+    found = False
+    for m in messages:
+        role = m.get("role") if isinstance(m, dict) else None
+        if role != "system":
+            continue
+        found = True
+        if _is_blank_text(_typed_text_of_content(m.get("content"))):
+            issues.append(_err("E002_SYSTEM_EMPTY", line_no, sample_id, "messages",
+                               "Profile requires a non-empty role='system' message, but system content is empty/blank."))
             break
+    if not found:
+        issues.append(_err("E002_SYSTEM_REQUIRED", line_no, sample_id, "messages",
+                           "Profile requires a role='system' message, but none is present."))
     return issues
 
 
@@ -145,19 +255,19 @@ def _mode_specific_checks(messages: List[Dict[str, Any]], line_no: int, sample_i
     issues: List[Issue] = []
     mode = (mode or "train").lower()
 
-    has_assistant = any(m.get("role") == "assistant" for m in messages)
+    # single scan: index of the first assistant turn (None if there is none)
+    idx = next((i for i, m in enumerate(messages) if isinstance(m, dict) and m.get("role") == "assistant"), None)
+    has_assistant = idx is not None
     if mode == "infer":
         if has_assistant:
             # label leakage risk
-            # point to first assistant if possible
-            idx = next((i for i, m in enumerate(messages) if m.get("role") == "assistant"), None)
-            path = f"messages[{idx}].role" if idx is not None else "messages"
-            issues.append(_issue("ERROR", "E001_INFER_HAS_ASSISTANT", line_no, sample_id, path,
-                                 "Inference sample contains an assistant turn (risk of label leakage / wrong prompt)."))
+            path = f"messages[{idx}].role"
+            issues.append(_err("E001_INFER_HAS_ASSISTANT", line_no, sample_id, path,
+                               "Inference sample contains an assistant turn (risk of label leakage / wrong prompt)."))
     else:  # train
         if not has_assistant:
-            issues.append(_issue("ERROR", "E001_TRAIN_MISSING_ASSISTANT", line_no, sample_id, "messages",
-                                 "Train sample contains no assistant turn (no supervision label)."))
+            issues.append(_err("E001_TRAIN_MISSING_ASSISTANT", line_no, sample_id, "messages",
+                               "Train sample contains no assistant turn (no supervision label)."))
     return issues
 
 
@@ -172,32 +282,117 @@ def lint_jsonl(
     issues: List[Issue] = []
     path = Path(jsonl_path)
 
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("rb", buffering=_READ_BUFFER) as f:
         for line_no, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception as e:
-                issues.append(_issue("ERROR", "E004_BAD_JSON", line_no, f"line_{line_no}", "$", f"Invalid JSON: {e}"))
-                continue
+            _lint_line(line, line_no, issues, mode=mode, profile_obj=profile_obj, strict_typed=strict_typed)
 
-            sample_id = str(obj.get("id", f"line_{line_no}"))
-            messages = obj.get("messages", None)
+    return issues
 
-            # schema
-            sch = _validate_messages_schema(messages, line_no, sample_id, strict_typed)
-            issues.extend(sch)
-            if sch and any(i.code in {"E003_SCHEMA_MISMATCH", "E004_BAD_JSON", "E012_BAD_FIELD_TYPE"} for i in sch):
-                # If messages isn't valid list, skip deeper checks.
-                if not isinstance(messages, list):
-                    continue
 
-            assert isinstance(messages, list)
-            issues.extend(_system_presence_and_nonempty(messages, line_no, sample_id, profile_obj))
-            issues.extend(_mode_specific_checks(messages, line_no, sample_id, mode))
+def _lint_line(line: bytes, line_no: int, issues: List[Issue], *, mode: str, profile_obj: Profile, strict_typed: bool) -> None:
+    line = line.strip()
+    if not line:
+        return
+    try:
+        obj = _loads(line)
+    except Exception as e:
+        issues.append(_err("E004_BAD_JSON", line_no, f"line_{line_no}", "$", f"Invalid JSON: {e}"))
+        return
 
+    sample_id = str(obj.get("id", f"line_{line_no}"))
+    messages = obj.get("messages", None)
+
+    # schema
+    sch = _validate_messages_schema(messages, line_no, sample_id, strict_typed)
+    issues.extend(sch)
+    # If messages isn't valid list, skip deeper checks (the schema pass already reported it).
+    if not isinstance(messages, list):
+        return
+
+    issues.extend(_system_presence_and_nonempty(messages, line_no, sample_id, profile_obj))
+    issues.extend(_mode_specific_checks(messages, line_no, sample_id, mode))
+
+
+def _line_aligned_ranges(path: str, n: int) -> List[Tuple[int, int]]:
+    """Split a file into <= n byte ranges, each starting at the beginning of a line."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for k in range(1, n):
+            pos = size * k // n
+            if pos <= bounds[-1]:
+                continue
+            # from the byte before `pos`, skip to the start of the next line
+            f.seek(pos - 1)
+            f.readline()
+            start = f.tell()
+            if bounds[-1] < start < size:
+                bounds.append(start)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _count_newlines(path: str, start: int, end: int) -> int:
+    n = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        left = end - start
+        while left > 0:
+            buf = f.read(min(left, 1 << 20))
+            if not buf:
+                break
+            n += buf.count(b"\n")
+            left -= len(buf)
+    return n
+
+
+def _lint_range(path: str, start: int, end: int, first_line_no: int, mode: str, profile_obj: Profile, strict_typed: bool) -> List[Issue]:
+    issues: List[Issue] = []
+    with open(path, "rb", buffering=_READ_BUFFER) as f:
+        f.seek(start)
+        pos = start
+        line_no = first_line_no
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            _lint_line(line, line_no, issues, mode=mode, profile_obj=profile_obj, strict_typed=strict_typed)
+            line_no += 1
+    return issues
+
+
+def lint_jsonl_parallel(
+    jsonl_path: str,
+    *,
+    workers: Optional[int] = None,
+    mode: str = "train",
+    profile_obj: Profile,
+    strict_typed: bool = False,
+) -> List[Issue]:
+    """Same result as lint_jsonl (same issues, same order), linting line-aligned chunks in worker processes.
+
+    Lines are independent, so the file is split into byte ranges at newline boundaries.
+    A first (cheap) pass counts newlines per range so every chunk knows its absolute line numbers.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = _line_aligned_ranges(jsonl_path, workers)
+    if workers <= 1 or len(ranges) <= 1:
+        return lint_jsonl(jsonl_path, mode=mode, profile_obj=profile_obj, strict_typed=strict_typed)
+
+    paths = [jsonl_path] * len(ranges)
+    starts = [a for a, _ in ranges]
+    ends = [b for _, b in ranges]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as ex:
+        counts = list(ex.map(_count_newlines, paths, starts, ends))
+        first_line_nos = [1]
+        for c in counts[:-1]:
+            first_line_nos.append(first_line_nos[-1] + c)
+        n = len(ranges)
+        chunks = ex.map(_lint_range, paths, starts, ends, first_line_nos, [mode] * n, [profile_obj] * n, [strict_typed] * n)
+        issues: List[Issue] = []
+        for chunk in chunks:
+            issues.extend(chunk)
     return issues
 
 
@@ -223,9 +418,10 @@ def fix_jsonl(
             if not raw.strip():
                 continue
             try:
+                # stdlib json on purpose: the rewritten file must round-trip exactly (big ints, NaN)
                 obj = json.loads(raw)
             except Exception as e:
-                issues.append(_issue("ERROR", "E004_BAD_JSON", line_no, f"line_{line_no}", "$", f"Invalid JSON: {e}"))
+                issues.append(_err("E004_BAD_JSON", line_no, f"line_{line_no}", "$", f"Invalid JSON: {e}"))
                 continue
 
             sample_id = str(obj.get("id", f"line_{line_no}"))
@@ -235,13 +431,13 @@ def fix_jsonl(
                     if isinstance(m, dict):
                         if m.get("role") == "usr":
                             m["role"] = "user"
-                            issues.append(_issue("INFO", "I901_FIX_ROLE_USR", line_no, sample_id, "messages[].role", "Fixed role 'usr' -> 'user'."))
+                            issues.append(_info("I901_FIX_ROLE_USR", line_no, sample_id, "messages[].role", "Fixed role 'usr' -> 'user'."))
 
                         if strict_typed and isinstance(m.get("content"), list):
                             for it in m["content"]:
                                 if isinstance(it, dict) and "type" not in it and "text" in it:
                                     it["type"] = "text"
-                                    issues.append(_issue("INFO", "I902_FIX_ADD_TYPE_TEXT", line_no, sample_id, "messages[].content[].type", "Added missing type='text' for item with 'text' field."))
+                                    issues.append(_info("I902_FIX_ADD_TYPE_TEXT", line_no, sample_id, "messages[].content[].type", "Added missing type='text' for item with 'text' field."))
 
             fout.write(json.dumps(obj, ensure_ascii=False) + "\n")
 
@@ -251,6 +447,10 @@ def fix_jsonl(
 # -----------------------------
 # verify-system: render-level check
 # -----------------------------
+# Conversations handed to a plugin's render_many(list_of_messages) -> list of prompts per call.
+_RENDER_BATCH = 64
+
+
 def _load_render_plugin(path: str):
     p = Path(path)
     if not p.exists():
@@ -262,7 +462,59 @@ def _load_render_plugin(path: str):
     spec.loader.exec_module(mod)  # type: ignore
     if not hasattr(mod, "render"):
         raise RuntimeError("render plugin must define a function: render(messages, **kwargs) -> str")
-    return mod.render
+    return mod.render, getattr(mod, "render_many", None)
+
+
+def _bind_render(render_fn):
+    """Pick the plugin calling convention once: render(messages=..., sample=...) if the
+    signature accepts it, else legacy render(messages). Avoids a TypeError per line."""
+    try:
+        inspect.signature(render_fn).bind(messages=None, sample=None)
+    except ValueError:
+        # signature not introspectable: keep the per-call fallback
+        def call(messages, obj):
+            try:
+                return render_fn(messages=messages, sample=obj)
+            except TypeError:
+                return render_fn(messages)
+        return call
+    except TypeError:
+        # plugin signature without kwargs
+        return lambda messages, obj: render_fn(messages)
+    return lambda messages, obj: render_fn(messages=messages, sample=obj)
+
+
+def _system_not_visible(prompt: Any, needle: str, line_no: int, sample_id: str, profile_obj: Profile) -> Optional[Issue]:
+    # check containment (best-effort substring)
+    if not needle or needle in (prompt if isinstance(prompt, str) else str(prompt)):
+        return None
+    return _issue(profile_obj.system_invisible_level, "E002_SYSTEM_NOT_VISIBLE", line_no, sample_id, "messages",
+                  "System message exists but is not present in the rendered prompt (likely dropped by the pipeline).")
+
+
+def _render_slots(issues: List[Any], slots: List[Tuple[int, Any, Any, int, str, str]], render, render_many_fn, profile_obj: Profile) -> None:
+    """Render a batch with render_many and fill each line's reserved slot in `issues`.
+
+    If render_many raises or returns the wrong number of prompts, the batch is rendered line by
+    line with `render` so each error lands on its own line.
+    """
+    try:
+        prompts: Optional[List[Any]] = list(render_many_fn([s[1] for s in slots]))
+    except Exception:
+        prompts = None
+    if prompts is not None and len(prompts) != len(slots):
+        prompts = None
+    for k, (idx, messages, obj, line_no, sample_id, needle) in enumerate(slots):
+        if prompts is not None:
+            prompt = prompts[k]
+        else:
+            try:
+                prompt = render(messages, obj)
+            except Exception as e:
+                issues[idx] = _err("E901_RENDER_PLUGIN_ERROR", line_no, sample_id, "messages", f"Render plugin error: {e}")
+                continue
+        issues[idx] = _system_not_visible(prompt, needle, line_no, sample_id, profile_obj)
+    slots.clear()
 
 
 def verify_system_visibility_jsonl(
@@ -272,19 +524,26 @@ def verify_system_visibility_jsonl(
     render_plugin_path: str,
     strict_typed: bool = False,
 ) -> List[Issue]:
-    """Verify that the system message exists AND appears in the final rendered prompt."""
-    issues: List[Issue] = []
-    render_fn = _load_render_plugin(render_plugin_path)
+    """Verify that the system message exists AND appears in the final rendered prompt.
+
+    Plugins that define render_many(list_of_messages) are called with batches of lines;
+    otherwise render is called once per line. Both give the same issues in the same order.
+    """
+    issues: List[Any] = []
+    render_fn, render_many_fn = _load_render_plugin(render_plugin_path)
+    render = _bind_render(render_fn)
+    # batched mode: (index of a placeholder in issues, messages, obj, line_no, sample_id, needle)
+    slots: List[Tuple[int, Any, Any, int, str, str]] = []
 
-    with Path(jsonl_path).open("r", encoding="utf-8") as f:
+    with Path(jsonl_path).open("rb", buffering=_READ_BUFFER) as f:
         for line_no, line in enumerate(f, start=1):
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _loads(line)
             except Exception as e:
-                issues.append(_issue("ERROR", "E004_BAD_JSON", line_no, f"line_{line_no}", "$", f"Invalid JSON: {e}"))
+                issues.append(_err("E004_BAD_JSON", line_no, f"line_{line_no}", "$", f"Invalid JSON: {e}"))
                 continue
 
             sample_id = str(obj.get("id", f"line_{line_no}"))
@@ -297,30 +556,40 @@ def verify_system_visibility_jsonl(
 
             # schema-level: require system and non-empty
             issues.extend(_system_presence_and_nonempty(messages, line_no, sample_id, profile_obj))
-            sys_texts = [_typed_text_of_content(m.get("content")) for m in messages if m.get("role") == "system"]
-            sys_text = "\n".join([t for t in sys_texts if isinstance(t, str)])
 
             if not profile_obj.system_visible:
                 # If profile doesn't require visibility, skip.
                 continue
 
+            sys_text = "\n".join(
+                _typed_text_of_content(m.get("content")) for m in messages if isinstance(m, dict) and m.get("role") == "system"
+            )
+
+            if render_many_fn is not None:
+                # keep file order: reserve this line's render result, filled in when the batch renders
+                slots.append((len(issues), messages, obj, line_no, sample_id, sys_text.strip()))
+                issues.append(None)
+                if len(slots) >= _RENDER_BATCH:
+                    _render_slots(issues, slots, render, render_many_fn, profile_obj)
+                continue
+
             # render prompt
             try:
-                prompt = render_fn(messages=messages, sample=obj)
-            except TypeError:
-                # plugin signature without kwargs
-                prompt = render_fn(messages)
+                prompt = render(messages, obj)
             except Exception as e:
-                issues.append(_issue("ERROR", "E901_RENDER_PLUGIN_ERROR", line_no, sample_id, "messages", f"Render plugin error: {e}"))
+                issues.append(_err("E901_RENDER_PLUGIN_ERROR", line_no, sample_id, "messages", f"Render plugin error: {e}"))
                 continue
 
-            # check containment (best-effort substring)
-            if sys_text.strip() and sys_text.strip() not in str(prompt):
-                level = profile_obj.system_invisible_level
-                issues.append(_issue(level, "E002_SYSTEM_NOT_VISIBLE", line_no, sample_id, "messages",
-                                     "System message exists but is not present in the rendered prompt (likely dropped by the pipeline)."))
+            issue = _system_not_visible(prompt, sys_text.strip(), line_no, sample_id, profile_obj)
+            if issue is not None:
+                issues.append(issue)
 
-    return issues
+    if render_many_fn is None:
+        return issues
+    if slots:
+        _render_slots(issues, slots, render, render_many_fn, profile_obj)
+    # drop the slots of lines whose system text was visible
+    return [i for i in issues if i is not None]
 
 
 # -----------------------------
@@ -336,6 +605,17 @@ def _iter_splits(ds_any):
         yield "data", ds_any
 
 
+_BATCH_SIZE = 1024
+
+
+def _iter_rows(ds, batch_size: int = _BATCH_SIZE) -> Iterable[Dict[str, Any]]:
+    """Yield rows as dicts, converting Arrow -> Python one batch at a time (not per row)."""
+    for batch in ds.iter(batch_size=batch_size):
+        cols = list(batch.keys())
+        for vals in zip(*(batch[c] for c in cols)):
+            yield dict(zip(cols, vals))
+
+
 def _find_image_columns(features: Dict[str, Any]) -> List[str]:
     cols: List[str] = []
     for k, v in features.items():
@@ -356,26 +636,59 @@ def _get_size_from_row(row: Dict[str, Any], image_cols: List[str], w_col: Option
         if hasattr(img, "size"):
             w, h = img.size
             return int(w), int(h)
-        # could be dict with 'width'/'height'
+        # could be dict with 'width'/'height', or an undecoded {"bytes", "path"} image
         if isinstance(img, dict):
             if isinstance(img.get("width"), int) and isinstance(img.get("height"), int):
                 return int(img["width"]), int(img["height"])
+            size = _image_header_size(img)
+            if size is not None:
+                return size
     return None
 
 
-def _walk_none(obj: Any, prefix: str = "") -> Iterable[str]:
-    """Yield paths where value is None (nested)."""
-    if obj is None:
-        yield prefix or "$"
-        return
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            p = f"{prefix}.{k}" if prefix else str(k)
-            yield from _walk_none(v, p)
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            p = f"{prefix}[{i}]"
-            yield from _walk_none(v, p)
+def _image_header_size(img: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """Size of an undecoded HF image; PIL's Image.open only parses the header, not the pixels."""
+    src = io.BytesIO(img["bytes"]) if img.get("bytes") else img.get("path")
+    if not src:
+        return None
+    try:
+        from PIL import Image  # type: ignore
+        with Image.open(src) as im:
+            w, h = im.size
+        return int(w), int(h)
+    except Exception:
+        return None
+
+
+def _coord_axis(key: str) -> Optional[str]:
+    """'x' / 'y' by key suffix (x0, x1, cx, ...), None if the key is neither."""
+    lk = key.lower()
+    if lk.endswith(("x", "x0", "x1", "cx")):
+        return "x"
+    if lk.endswith(("y", "y0", "y1", "cy")):
+        return "y"
+    return None
+
+
+def _walk_none(obj: Any, max_hits: int = 32) -> Iterable[str]:
+    """Yield paths where value is None (nested), depth-first, at most `max_hits` of them.
+
+    Iterative (explicit stack) to avoid one generator frame per nesting level;
+    children are pushed in reverse so paths come out in document order.
+    """
+    hits = 0
+    stack: List[Tuple[Any, str]] = [(obj, "")]
+    while stack:
+        o, prefix = stack.pop()
+        if o is None:
+            yield prefix or "$"
+            hits += 1
+            if hits >= max_hits:
+                return
+        elif isinstance(o, dict):
+            stack.extend(reversed([(v, f"{prefix}.{k}" if prefix else str(k)) for k, v in o.items()]))
+        elif isinstance(o, list):
+            stack.extend(reversed([(v, f"{prefix}[{i}]") for i, v in enumerate(o)]))
 
 
 def check_dataset_on_disk(
@@ -400,10 +713,14 @@ def check_dataset_on_disk(
     try:
         from datasets import load_from_disk  # type: ignore
     except Exception as e:
-        return [_issue("ERROR", "E900_DATASETS_IMPORT", 1, "dataset", "$", f"Cannot import datasets: {e}")]
+        return [_err("E900_DATASETS_IMPORT", 1, "dataset", "$", f"Cannot import datasets: {e}")]
 
     ds_any = load_from_disk(dataset_path)
 
+    # classify coord keys by axis and split the (possibly nested) coord field once, not per row
+    coord_axes = [_coord_axis(k) for k in coord_keys] if coord_keys else []
+    coord_parts = tuple(coord_field.split(".")) if coord_field else ()
+
     for split_name, ds in _iter_splits(ds_any):
         features = getattr(ds, "features", {}) or {}
         image_cols = _find_image_columns(features)
@@ -412,35 +729,46 @@ def check_dataset_on_disk(
         w_col = "image_w" if "image_w" in features else ("width" if "width" in features else None)
         h_col = "image_h" if "image_h" in features else ("height" if "height" in features else None)
 
+        # With explicit w/h columns there is no need to decode every image: rows get raw
+        # {"bytes", "path"} dicts instead (header-only size read if a row's w/h is missing).
+        raw_image_cols: set = set()
+        if w_col and h_col and image_cols:
+            from datasets import Image as HFImage  # type: ignore
+            for c in image_cols:
+                ds = ds.cast_column(c, HFImage(decode=False))
+            raw_image_cols = set(image_cols)
+
         seen_sizes: Dict[Tuple[int, int], int] = {}
 
-        for idx, row in enumerate(ds):
+        for idx, row in enumerate(_iter_rows(ds)):
             row_no = idx + 1
             sample_id = str(row.get("id", f"{split_name}:{row_no}"))
 
             # (1) nested None check (but do not flag top-level 'image' missing — only actual None values)
-            for p in _walk_none(row):
-                issues.append(_issue("ERROR", "E102_DATASET_NONE_VALUE", row_no, sample_id, p,
-                                     f"{p} is None (often happens when missing nested key gets filled as None after cast/save)."))
+            # Raw image dicts may legitimately carry path=None; only the image value itself is checked.
+            walk_row = {k: v for k, v in row.items() if v is None or k not in raw_image_cols} if raw_image_cols else row
+            for p in _walk_none(walk_row):
+                issues.append(_err("E102_DATASET_NONE_VALUE", row_no, sample_id, p,
+                                   f"{p} is None (often happens when missing nested key gets filled as None after cast/save)."))
 
             # (2) image size checks
             size = _get_size_from_row(row, image_cols=image_cols, w_col=w_col, h_col=h_col)
             if size is not None:
                 seen_sizes[size] = seen_sizes.get(size, 0) + 1
                 if expect_size is not None and size != expect_size:
-                    issues.append(_issue("ERROR", "E201_IMAGE_SIZE_MISMATCH", row_no, sample_id, "image",
-                                         f"Image size {size[0]}x{size[1]} != expected {expect_size[0]}x{expect_size[1]}."))
+                    issues.append(_err("E201_IMAGE_SIZE_MISMATCH", row_no, sample_id, "image",
+                                       f"Image size {size[0]}x{size[1]} != expected {expect_size[0]}x{expect_size[1]}."))
             else:
                 # No size info available -> warn (can't check)
-                issues.append(_issue("WARN", "W202_IMAGE_SIZE_UNKNOWN", row_no, sample_id, "image",
-                                     "Cannot determine image size (no Image column and no width/height columns)."))
+                issues.append(_warn("W202_IMAGE_SIZE_UNKNOWN", row_no, sample_id, "image",
+                                    "Cannot determine image size (no Image column and no width/height columns)."))
 
             # (3) optional coord sanity
             if coord_field and coord_keys:
                 # row field could be nested "a.b.c"
                 cur = row
                 ok = True
-                for part in coord_field.split("."):
+                for part in coord_parts:
                     if isinstance(cur, dict) and part in cur:
                         cur = cur[part]
                     else:
@@ -454,16 +782,14 @@ def check_dataset_on_disk(
                         w, h = size
                         # generic rule: coords must be within [0,w] / [0,h]
                         bad = False
-                        for k, v in zip(coord_keys, vals):
-                            if k.lower().endswith(("x", "x0", "x1", "cx")):
-                                if v < 0 or v > w:
-                                    bad = True
-                            if k.lower().endswith(("y", "y0", "y1", "cy")):
-                                if v < 0 or v > h:
-                                    bad = True
+                        for axis, v in zip(coord_axes, vals):
+                            lim = w if axis == "x" else (h if axis == "y" else None)
+                            if lim is not None and (v < 0 or v > lim):
+                                bad = True
+                                break
                         if bad:
-                            issues.append(_issue("WARN", "W301_COORD_OUT_OF_BOUNDS", row_no, sample_id, coord_field,
-                                                 f"Coordinates out of bounds for image {w}x{h}: { {k: cur.get(k) for k in coord_keys} }"))
+                            issues.append(_warn("W301_COORD_OUT_OF_BOUNDS", row_no, sample_id, coord_field,
+                                                f"Coordinates out of bounds for image {w}x{h}: { {k: cur.get(k) for k in coord_keys} }"))
 
         # After iterating split: size_policy=consistent
         if (size_policy or "any").lower() == "consistent":
@@ -473,9 +799,9 @@ def check_dataset_on_disk(
                 top = sorted(seen_sizes.items(), key=lambda kv: kv[1], reverse=True)[:5]
                 msg = "Inconsistent image sizes in split "
                 msg += f"{split_name}: " + ", ".join([f"{w}x{h} ({c})" for (w, h), c in top])
-                issues.append(_issue("WARN", "W201_IMAGE_SIZE_INCONSISTENT", 1, f"{split_name}", "image", msg))
+                issues.append(_warn("W201_IMAGE_SIZE_INCONSISTENT", 1, f"{split_name}", "image", msg))
             elif len(seen_sizes) == 0:
-                issues.append(_issue("WARN", "W202_IMAGE_SIZE_UNKNOWN", 1, f"{split_name}", "image",
-                                     "Cannot determine image sizes for this split."))
+                issues.append(_warn("W202_IMAGE_SIZE_UNKNOWN", 1, f"{split_name}", "image",
+                                    "Cannot determine image sizes for this split."))
 
     return issues
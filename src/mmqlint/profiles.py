@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 import json
@@ -28,17 +29,31 @@ class Profile:
     system_invisible_level: str = "ERROR"  # "WARN" or "ERROR"
 
     def validate(self) -> None:
-        if self.system_invisible_level not in {"WARN", "ERROR"}:
-            raise ValueError(f"system_invisible_level must be WARN|ERROR, got {self.system_invisible_level}")
-        if self.require_system and not self.system_visible:
-            # Your stated policy: system must be present AND visible.
-            raise ValueError(f"profile {self.name}: require_system=True implies system_visible=True")
-        if self.require_system and self.fold_system_into_user:
-            raise ValueError(f"profile {self.name}: fold_system_into_user must be False when require_system=True")
-        if self.fold_system_into_user and self.system_visible:
-            # If you're folding, you *usually* don't rely on system visibility.
-            # We don't forbid it, but it is confusing; keep strict here.
-            raise ValueError(f"profile {self.name}: fold_system_into_user=True conflicts with system_visible=True")
+        try:
+            hash(self)
+        except TypeError:
+            # a profile file gave a field a list/dict value: validate without the cache
+            _check_profile(self)
+            return
+        _validate_profile(self)
+
+
+def _check_profile(p: Profile) -> None:
+    if p.system_invisible_level not in {"WARN", "ERROR"}:
+        raise ValueError(f"system_invisible_level must be WARN|ERROR, got {p.system_invisible_level}")
+    if p.require_system and not p.system_visible:
+        # Your stated policy: system must be present AND visible.
+        raise ValueError(f"profile {p.name}: require_system=True implies system_visible=True")
+    if p.require_system and p.fold_system_into_user:
+        raise ValueError(f"profile {p.name}: fold_system_into_user must be False when require_system=True")
+    if p.fold_system_into_user and p.system_visible:
+        # If you're folding, you *usually* don't rely on system visibility.
+        # We don't forbid it, but it is confusing; keep strict here.
+        raise ValueError(f"profile {p.name}: fold_system_into_user=True conflicts with system_visible=True")
+
+
+# Profile is frozen (hashable), so each distinct profile is validated once per process.
+_validate_profile = lru_cache(maxsize=None)(_check_profile)
 
 
 DEFAULT_PROFILES: Dict[str, Profile] = {
@@ -73,10 +88,11 @@ def load_profiles(profile_file: Optional[str] = None) -> Dict[str, Profile]:
     """
     profs: Dict[str, Profile] = dict(DEFAULT_PROFILES)
 
+    # validate defaults (memoized: only the first call does any work)
+    for p in profs.values():
+        p.validate()
+
     if not profile_file:
-        # validate defaults
-        for p in profs.values():
-            p.validate()
         return profs
 
     if profile_file.endswith((".yaml", ".yml")):
@@ -104,8 +120,4 @@ def load_profiles(profile_file: Optional[str] = None) -> Dict[str, Profile]:
         p.validate()
         profs[name] = p
 
-    # validate all
-    for p in profs.values():
-        p.validate()
-
     return profs
@@ -1,6 +1,9 @@
 # src/mmqlint/dataset_checks.py
 from __future__ import annotations
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -11,15 +14,24 @@ def _is_blank_text(x: Any) -> bool:
         return True
     return False
 
-def _get_by_path(obj: Any, path: str) -> Any:
-    cur = obj
-    for key in path.split("."):
-        if not isinstance(cur, dict):
-            return None
-        if key not in cur:
-            return None
-        cur = cur[key]
-    return cur
+def _leaf_null_mask(batch: Any, keys: Tuple[str, ...]) -> Any:
+    """
+    NumPy bool mask of rows where the nested path reads as None, computed from Arrow null bitmaps.
+    struct_field propagates parent nulls, so a None struct marks all of its leaves.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if keys[0] not in batch.column_names:
+        return np.ones(batch.num_rows, dtype=bool)
+    arr = batch.column(keys[0]).combine_chunks()
+    for key in keys[1:]:
+        if not pa.types.is_struct(arr.type) or arr.type.get_field_index(key) < 0:
+            # not a struct or no such key: the path is None on every row
+            return np.ones(batch.num_rows, dtype=bool)
+        arr = pc.struct_field(arr, [key])
+    return pc.is_null(arr).to_numpy(zero_copy_only=False)
 
 def _list_leaf_paths(features: Any, prefix: str = "") -> List[str]:
     """
@@ -27,23 +39,215 @@ def _list_leaf_paths(features: Any, prefix: str = "") -> List[str]:
     We traverse dicts; leaf nodes are non-dict feature objects.
     """
     out: List[str] = []
-    if isinstance(features, dict):
-        for k, v in features.items():
-            p = f"{prefix}.{k}" if prefix else k
-            out.extend(_list_leaf_paths(v, p))
-    else:
-        # leaf
-        out.append(prefix)
+    stack: List[Tuple[Any, str]] = [(features, prefix)]
+    while stack:
+        f, pre = stack.pop()
+        if isinstance(f, dict):
+            # push in reverse so paths come out in declaration order
+            stack.extend((v, f"{pre}.{k}" if pre else k) for k, v in reversed(f.items()))
+        else:
+            # leaf
+            out.append(pre)
     return out
 
-@dataclass(frozen=True)
+_BATCH_ROWS = 8192
+
+def _is_int_type(t: Any) -> bool:
+    import pyarrow as pa
+
+    # mirrors isinstance(v, int), which bool also satisfies
+    return pa.types.is_integer(t) or pa.types.is_boolean(t)
+
+def _as_numbers(arr: Any) -> Any:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_boolean(arr.type):
+        arr = arr.cast(pa.int8())
+    return pc.fill_null(arr, 0).to_numpy(zero_copy_only=False)
+
+def _coordinate_masks(
+    batch: Any,
+    image_w_field: str,
+    image_h_field: str,
+    coordinates_prefix: str,
+    coordinates_fields: Tuple[str, str, str, str],
+) -> Optional[Tuple[Any, Any, Any, Any, Any]]:
+    """
+    Vectorized coordinate checks over one Arrow slice.
+    Returns (flagged, bad_type, negative, out_of_bounds, looks_like_1000) NumPy bool arrays,
+    or None when the schema rules the check out for every row (no int image size, no struct coordinates).
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    names = batch.column_names
+    if image_w_field not in names or image_h_field not in names or coordinates_prefix not in names:
+        return None
+    w = batch.column(image_w_field).combine_chunks()
+    h = batch.column(image_h_field).combine_chunks()
+    c = batch.column(coordinates_prefix).combine_chunks()
+    if not (_is_int_type(w.type) and _is_int_type(h.type) and pa.types.is_struct(c.type)):
+        return None
+    if any(c.type.get_field_index(k) < 0 for k in coordinates_fields):
+        # A missing subkey reads as None on every row (caught by E101)
+        return None
+
+    parts = [pc.struct_field(c, [k]) for k in coordinates_fields]
+    checked = pc.and_(pc.is_valid(w), pc.is_valid(h))
+    for a in parts:
+        checked = pc.and_(checked, pc.is_valid(a))
+    checked = checked.to_numpy(zero_copy_only=False)
+
+    nothing = np.zeros(len(checked), dtype=bool)
+    if not all(_is_int_type(a.type) or pa.types.is_floating(a.type) for a in parts):
+        return checked, checked, nothing, nothing, nothing
+
+    iw, ih = _as_numbers(w), _as_numbers(h)
+    x0, y0, x1, y1 = (_as_numbers(a) for a in parts)
+    negative = checked & ((x0 < 0) | (y0 < 0) | (x1 < 0) | (y1 < 0))
+    out_of_bounds = checked & ((x1 > iw) | (y1 > ih))
+    mx = np.maximum(x1, y1)
+    looks_like_1000 = (iw <= 600) & (ih <= 600) & (mx >= 800) & (mx <= 1200)
+    return negative | out_of_bounds, nothing, negative, out_of_bounds, looks_like_1000
+
+_MESSAGES: Dict[str, str] = {
+    "E100_DATASET_DEP_MISSING": "Failed to import datasets.load_from_disk. Please `pip install datasets`. Details: {0}",
+    "E101_DATASET_NONE_FILLED": "{0} is None (likely filled due to missing nested key during cast/save).",
+    "E102_coordinates_BAD_TYPE": "coordinates coords must be numeric; got [{0!r}, {1!r}, {2!r}, {3!r}]",
+    "E103_coordinates_NEGATIVE": "coordinates has negative coords: [{0!r}, {1!r}, {2!r}, {3!r}]",
+    "E104_coordinates_OUT_OF_BOUNDS": "coordinates exceeds image size {0}x{1}: ({2}, {3}, {4}, {5})",
+    "E105_coordinates_SPACE_MISMATCH": "coordinates exceeds image size {0}x{1}: ({2}, {3}, {4}, {5}) (looks like 1000-space coords; expected pixel space)",
+}
+
+# __slots__ (no per-instance __dict__) where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class DatasetIssue:
     level: str          # "ERROR" | "WARN" | "INFO"
     code: str           # e.g., "E101_DATASET_NONE_FILLED"
     row: int            # 0-based row index
     sample_id: str      # from a column (default "id") if present, else "row_{i}"
     path: str           # e.g., "meta.b"
-    message: str
+    message: str        # formatted once from the code's template in _MESSAGES
+
+def _lint_split(
+    ds: Any,
+    split_name: str,
+    leaf_paths: List[str],
+    *,
+    id_field: str,
+    image_w_field: str,
+    image_h_field: str,
+    coordinates_prefix: str,
+    coordinates_fields: Tuple[str, str, str, str],
+    max_rows: Optional[int],
+) -> List[DatasetIssue]:
+    import numpy as np
+
+    issues: List[DatasetIssue] = []
+    n = len(ds) if max_rows is None else min(len(ds), max_rows)
+
+    # Columnar access: project to the columns the checks touch (never the image column)
+    # and scan them one Arrow slice at a time instead of materializing ds[i] per row
+    needed = {id_field, image_w_field, image_h_field, coordinates_prefix}
+    # Split each leaf path once, not per row
+    compiled = [(p, tuple(p.split("."))) for p in leaf_paths]
+    needed.update(keys[0] for _, keys in compiled)
+    keep = [c for c in ds.column_names if c in needed]
+    tbl = ds.select_columns(keep) if keep else ds
+    # An empty projection still has to keep the row count (missing leaf roots flag every row)
+    tbl = tbl.with_format("arrow")[:n].select(keep)
+
+    for start in range(0, n, _BATCH_ROWS):
+        batch = tbl.slice(start, min(_BATCH_ROWS, n - start))
+
+        # (1) nested leaf paths None check: one null bitmap per path
+        leaf_nulls = [(p, _leaf_null_mask(batch, keys)) for p, keys in compiled]
+        masks = _coordinate_masks(batch, image_w_field, image_h_field, coordinates_prefix, coordinates_fields)
+
+        visit = np.zeros(batch.num_rows, dtype=bool)
+        for _, m in leaf_nulls:
+            visit |= m
+        if masks is not None:
+            visit |= masks[0]
+        if not visit.any():
+            continue
+
+        # Python values are only needed to format issues for the visited rows
+        ids = batch.column(id_field).to_pylist() if id_field in batch.column_names else None
+        if masks is not None and masks[0].any():
+            ws = batch.column(image_w_field).to_pylist()
+            hs = batch.column(image_h_field).to_pylist()
+            cs = batch.column(coordinates_prefix).to_pylist()
+        for j in np.flatnonzero(visit).tolist():
+            i = start + j
+            sid = str(ids[j]) if ids is not None else f"{split_name}:row_{i}"
+
+            for p, m in leaf_nulls:
+                if m[j]:
+                    issues.append(DatasetIssue(
+                        level="ERROR",
+                        code="E101_DATASET_NONE_FILLED",
+                        row=i,
+                        sample_id=sid,
+                        path=p,
+                        message=_MESSAGES["E101_DATASET_NONE_FILLED"].format(p),
+                    ))
+
+            # (2) coordinates out-of-bounds check (decided by the batch masks)
+            # Rows with missing/None coordinate subkeys are never flagged (they are caught by E101)
+            if masks is None or not masks[0][j]:
+                continue
+            _, bad_type, negative, out_of_bounds, looks_like_1000 = masks
+            iw = ws[j]
+            ih = hs[j]
+            coordinates = cs[j]
+            coords = tuple(coordinates[k] for k in coordinates_fields)
+
+            # basic sanity
+            if bad_type[j]:
+                issues.append(DatasetIssue(
+                    level="ERROR",
+                    code="E102_coordinates_BAD_TYPE",
+                    row=i,
+                    sample_id=sid,
+                    path=coordinates_prefix,
+                    message=_MESSAGES["E102_coordinates_BAD_TYPE"].format(*coords),
+                ))
+                continue
+
+            if negative[j]:
+                issues.append(DatasetIssue(
+                    level="ERROR",
+                    code="E103_coordinates_NEGATIVE",
+                    row=i,
+                    sample_id=sid,
+                    path=coordinates_prefix,
+                    message=_MESSAGES["E103_coordinates_NEGATIVE"].format(*coords),
+                ))
+
+            if out_of_bounds[j]:
+                # Further judge whether it looks like a 1000-space
+                code = "E105_coordinates_SPACE_MISMATCH" if looks_like_1000[j] else "E104_coordinates_OUT_OF_BOUNDS"
+                issues.append(DatasetIssue(
+                    level="ERROR",
+                    code=code,
+                    row=i,
+                    sample_id=sid,
+                    path=coordinates_prefix,
+                    message=_MESSAGES[code].format(iw, ih, *coords),
+                ))
+
+    return issues
+
+def _lint_split_on_disk(path: str, split_name: str, leaf_paths: List[str], **opts: Any) -> List[DatasetIssue]:
+    # Worker entry: re-open the split from disk rather than pickling Arrow tables across processes
+    from datasets import load_from_disk
+
+    return _lint_split(load_from_disk(path, keep_in_memory=False)[split_name], split_name, leaf_paths, **opts)
 
 def lint_dataset_on_disk(
     path: str,
@@ -56,11 +260,15 @@ def lint_dataset_on_disk(
     coordinates_prefix: str = "coordinates",
     coordinates_fields: Tuple[str, str, str, str] = ("x0", "y0", "x1", "y1"),
     max_rows: Optional[int] = None,
+    workers: Optional[int] = 1,
 ) -> List[DatasetIssue]:
     """
     Dataset-level checks:
         1) The features declare nested keys, but during writing or saving some keys are missing -> after cast or save they get filled in as None
         2) The coordinate system or resolution for coordinates is inconsistent: coordinates exceed image_w or image_h for example 900,950 appears in a 512x512 image
+
+    Splits of a DatasetDict are linted serially by default; workers=N lints them in up to N processes
+    (None or 0: one per CPU).
     """
     try:
         from datasets import load_from_disk, DatasetDict
@@ -71,20 +279,19 @@ def lint_dataset_on_disk(
             row=0,
             sample_id="dataset",
             path="$",
-            message=f"Failed to import datasets.load_from_disk. Please `pip install datasets`. Details: {e}",
+            message=_MESSAGES["E100_DATASET_DEP_MISSING"].format(e),
         )]
 
-    ds_obj = load_from_disk(path)
+    # Memory-map the Arrow files; only the projected columns below are ever read
+    ds_obj = load_from_disk(path, keep_in_memory=False)
 
     # Normalize to list of (split_name, dataset)
-    splits: List[Tuple[str, Any]] = []
-    if ds_obj.__class__.__name__ == "DatasetDict":  # avoid hard import typing issues
-        for k in ds_obj.keys():
-            splits.append((k, ds_obj[k]))
-    else:
-        splits.append(("data", ds_obj))
+    splits: List[Tuple[str, Any]] = list(ds_obj.items()) if isinstance(ds_obj, DatasetDict) else [("data", ds_obj)]
 
-    issues: List[DatasetIssue] = []
+    jobs: List[Tuple[str, Any, List[str]]] = []
+    # Splits of a DatasetDict usually share one schema; walk it once
+    seen_feats: Any = None
+    seen_paths: List[str] = []
 
     for split_name, ds in splits:
         # Build leaf paths from features (only for nested structs)
@@ -93,86 +300,41 @@ def lint_dataset_on_disk(
             # ds.features is dict-like mapping of columns to Feature
             try:
                 feats = ds.features
-                # find nested dict columns
-                for col, f in feats.items():
-                    if isinstance(f, dict):
-                        leaf_paths.extend(_list_leaf_paths({col: f}))
+                if seen_feats is None or feats != seen_feats:
+                    seen_paths = []
+                    # find nested dict columns
+                    for col, f in feats.items():
+                        if isinstance(f, dict):
+                            seen_paths.extend(_list_leaf_paths({col: f}))
+                    seen_feats = feats
+                leaf_paths = list(seen_paths)
             except Exception:
                 leaf_paths = []
 
         if forbid_none_paths:
             leaf_paths.extend([p for p in forbid_none_paths if p not in leaf_paths])
 
-        n = len(ds) if max_rows is None else min(len(ds), max_rows)
-
-        for i in range(n):
-            row = ds[i]
-            sid = str(row.get(id_field, f"{split_name}:row_{i}"))
-
-            # (1) nested leaf paths None check
-            for p in leaf_paths:
-                v = _get_by_path(row, p)
-                if v is None:
-                    issues.append(DatasetIssue(
-                        level="ERROR",
-                        code="E101_DATASET_NONE_FILLED",
-                        row=i,
-                        sample_id=sid,
-                        path=p,
-                        message=f"{p} is None (likely filled due to missing nested key during cast/save).",
-                    ))
-
-            # (2) coordinates out-of-bounds check
-            iw = row.get(image_w_field, None)
-            ih = row.get(image_h_field, None)
-            coordinates = row.get(coordinates_prefix, None)
-
-            if isinstance(iw, int) and isinstance(ih, int) and isinstance(coordinates, dict):
-                x0 = coordinates.get(coordinates_fields[0], None)
-                y0 = coordinates.get(coordinates_fields[1], None)
-                x1 = coordinates.get(coordinates_fields[2], None)
-                y1 = coordinates.get(coordinates_fields[3], None)
-
-                coords = [x0, y0, x1, y1]
-                if any(c is None for c in coords):
-                    # If subkeys of coordinates are missing or None, do not report repeatedly here (it will be caught by E101)
-                    continue
+        jobs.append((split_name, ds, leaf_paths))
 
-                # basic sanity
-                if not all(isinstance(c, (int, float)) for c in coords):
-                    issues.append(DatasetIssue(
-                        level="ERROR",
-                        code="E102_coordinates_BAD_TYPE",
-                        row=i,
-                        sample_id=sid,
-                        path=coordinates_prefix,
-                        message=f"coordinates coords must be numeric; got {coords}",
-                    ))
-                    continue
-
-                if x0 < 0 or y0 < 0 or x1 < 0 or y1 < 0:
-                    issues.append(DatasetIssue(
-                        level="ERROR",
-                        code="E103_coordinates_NEGATIVE",
-                        row=i,
-                        sample_id=sid,
-                        path=coordinates_prefix,
-                        message=f"coordinates has negative coords: {coords}",
-                    ))
-
-                if x1 > iw or y1 > ih:
-                    # Further judge whether it looks like a 1000-space
-                    looks_like_1000 = (iw <= 600 and ih <= 600 and max(x1, y1) >= 800 and max(x1, y1) <= 1200)
-                    code = "E105_coordinates_SPACE_MISMATCH" if looks_like_1000 else "E104_coordinates_OUT_OF_BOUNDS"
-                    hint = " (looks like 1000-space coords; expected pixel space)" if looks_like_1000 else ""
-                    issues.append(DatasetIssue(
-                        level="ERROR",
-                        code=code,
-                        row=i,
-                        sample_id=sid,
-                        path=coordinates_prefix,
-                        message=f"coordinates exceeds image size {iw}x{ih}: ({x0}, {y0}, {x1}, {y1}){hint}",
-                    ))
+    opts = dict(
+        id_field=id_field,
+        image_w_field=image_w_field,
+        image_h_field=image_h_field,
+        coordinates_prefix=coordinates_prefix,
+        coordinates_fields=coordinates_fields,
+        max_rows=max_rows,
+    )
+    issues: List[DatasetIssue] = []
+    # Splits are independent; lint them in separate processes when there is more than one
+    n_workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            futures = [ex.submit(_lint_split_on_disk, path, split_name, leaf_paths, **opts) for split_name, _, leaf_paths in jobs]
+            for fut in futures:
+                issues.extend(fut.result())
+    else:
+        for split_name, ds, leaf_paths in jobs:
+            issues.extend(_lint_split(ds, split_name, leaf_paths, **opts))
 
     return issues
 
@@ -17,6 +17,7 @@ JSONL
 - train_missing_assistant.jsonl
 - infer_has_assistant.jsonl
 - typed_ok.jsonl
+- numeric_edge.jsonl
 
 Datasets (HF save_to_disk directories)
 - demo_ds_img_bad_none
@@ -39,9 +40,15 @@ import os
 import shutil
 import string
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 
 def _rand_suffix(n: int = 6) -> str:
     alphabet = string.ascii_letters + string.digits
@@ -61,9 +68,11 @@ def _ensure_empty_dir(path: Path, overwrite: bool) -> None:
 
 def _write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly; write the whole file in one call
+        path.write_bytes(b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in rows))
+        return
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")
 
 
 def generate_jsonl_fixtures(out_dir: Path) -> None:
@@ -109,22 +118,43 @@ def generate_jsonl_fixtures(out_dir: Path) -> None:
         ],
     )
 
+    # Numeric edge cases that must parse and round-trip through `check --fix` exactly as
+    # stdlib json does: integers outside 64 bits and NaN/Infinity literals.
+    # Written as raw text because orjson cannot emit either.
+    (out_dir / "numeric_edge.jsonl").write_text(
+        '{"id": 12345678901234567890123, "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}], "score": NaN}\n'
+        '{"id": -9223372036854775809, "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}], "w": Infinity}\n'
+        '{"id": 98765432109876543210, "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi."}]}\n',
+        encoding="utf-8",
+    )
+
 
 def generate_dataset_fixtures(out_dir: Path) -> None:
     # Keep imports local so users who only want JSONL fixtures can still import the module.
     from datasets import Dataset, Features, Value, Image as HFImage  # type: ignore
     from PIL import Image  # type: ignore
-    import numpy as np  # type: ignore
 
     img_dir = out_dir / "demo_images"
     img_dir.mkdir(parents=True, exist_ok=True)
 
     def save_img(name: str, w: int, h: int) -> str:
-        arr = np.zeros((h, w, 3), dtype=np.uint8)
+        # Solid black image allocated inside PIL; fast zlib level since size on disk does not matter
         p = img_dir / name
-        Image.fromarray(arr).save(p)
+        Image.new("RGB", (w, h), (0, 0, 0)).save(p, optimize=False, compress_level=1)
         return str(p)
 
+    # Encode all fixture images up front on a thread pool (PNG encoding releases the GIL)
+    image_specs = [
+        ("ok0.png", 512, 512),
+        ("m0.png", 512, 512),
+        ("m1.png", 512, 512),
+        ("c1.png", 512, 512),
+        ("a1.png", 640, 480),
+        ("a2.png", 512, 512),
+    ]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        images = dict(zip((name for name, _, _ in image_specs), ex.map(lambda spec: save_img(*spec), image_specs)))
+
     features = Features(
         {
             "id": Value("string"),
@@ -136,11 +166,11 @@ def generate_dataset_fixtures(out_dir: Path) -> None:
         }
     )
 
-    # C2 fixture: nested keys missing -> cast fills None
+    # C2 fixture: nested keys missing -> encoding with features fills None
     rows_bad_none = [
         {
             "id": "ok0",
-            "image": save_img("ok0.png", 512, 512),
+            "image": images["ok0.png"],
             "image_w": 512,
             "image_h": 512,
             "meta": {"a": 1, "b": 2},
@@ -148,22 +178,22 @@ def generate_dataset_fixtures(out_dir: Path) -> None:
         },
         {
             "id": "missing_meta_b",
-            "image": save_img("m0.png", 512, 512),
+            "image": images["m0.png"],
             "image_w": 512,
             "image_h": 512,
-            "meta": {"a": 9},  # missing b -> cast fills None
+            "meta": {"a": 9},  # missing b -> filled with None
             "coordinates": {"x0": 5, "y0": 5, "x1": 60, "y1": 60},
         },
         {
             "id": "missing_coordinates_y1",
-            "image": save_img("m1.png", 512, 512),
+            "image": images["m1.png"],
             "image_w": 512,
             "image_h": 512,
             "meta": {"a": 1, "b": 2},
-            "coordinates": {"x0": 10, "y0": 10, "x1": 100},  # missing y1 -> cast fills None
+            "coordinates": {"x0": 10, "y0": 10, "x1": 100},  # missing y1 -> filled with None
         },
     ]
-    ds_bad_none = Dataset.from_list(rows_bad_none).cast(features)
+    ds_bad_none = Dataset.from_list(rows_bad_none, features=features)
     out_bad_none = out_dir / "demo_ds_img_bad_none"
     if out_bad_none.exists():
         shutil.rmtree(out_bad_none)
@@ -173,14 +203,14 @@ def generate_dataset_fixtures(out_dir: Path) -> None:
     rows_coord_warn = [
         {
             "id": "coords_look_like_1000_space",
-            "image": save_img("c1.png", 512, 512),
+            "image": images["c1.png"],
             "image_w": 512,
             "image_h": 512,
             "meta": {"a": 1, "b": 2},
             "coordinates": {"x0": 50, "y0": 80, "x1": 900, "y1": 950},
         }
     ]
-    ds_coord_warn = Dataset.from_list(rows_coord_warn).cast(features)
+    ds_coord_warn = Dataset.from_list(rows_coord_warn, features=features)
     out_coord_warn = out_dir / "demo_ds_coord_warn"
     if out_coord_warn.exists():
         shutil.rmtree(out_coord_warn)
@@ -190,7 +220,7 @@ def generate_dataset_fixtures(out_dir: Path) -> None:
     rows_all_ok = [
         {
             "id": "ok1",
-            "image": save_img("a1.png", 640, 480),
+            "image": images["a1.png"],
             "image_w": 640,
             "image_h": 480,
             "meta": {"a": 1, "b": 2},
@@ -198,14 +228,14 @@ def generate_dataset_fixtures(out_dir: Path) -> None:
         },
         {
             "id": "ok2",
-            "image": save_img("a2.png", 512, 512),
+            "image": images["a2.png"],
             "image_w": 512,
             "image_h": 512,
             "meta": {"a": 3, "b": 4},
             "coordinates": {"x0": 0, "y0": 0, "x1": 511, "y1": 511},
         },
     ]
-    ds_all_ok = Dataset.from_list(rows_all_ok).cast(features)
+    ds_all_ok = Dataset.from_list(rows_all_ok, features=features)
     out_all_ok = out_dir / "demo_ds_all_ok"
     if out_all_ok.exists():
         shutil.rmtree(out_all_ok)
@@ -1,15 +1,18 @@
 from datasets import Dataset, Features, Value, Image
 from PIL import Image as PILImage
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 os.makedirs("demo_images", exist_ok=True)
 
-# Generate some sample images
-paths = []
-for i in range(4):
+def save_image(i):
     p = f"demo_images/{i}.png"
-    PILImage.new("RGB", (512, 512)).save(p)
-    paths.append(p)
+    PILImage.new("RGB", (512, 512)).save(p, compress_level=1)
+    return p
+
+# Generate some sample images (PNG encoding releases the GIL, so threads overlap)
+with ThreadPoolExecutor() as ex:
+    paths = list(ex.map(save_image, range(4)))
 
 data = {
   "id": ["ok0","missing_meta_b","missing_coordinates_y1","coords_look_like_1000_space"],
@@ -32,7 +35,7 @@ features = Features({
   "coordinates": {"x0": Value("int32"), "y0": Value("int32"), "x1": Value("int32"), "y1": Value("int32")},
 })
 
-ds = Dataset.from_dict(data).cast(features)
+ds = Dataset.from_dict(data, features=features)
 ds.save_to_disk("demo_ds_img")
 print("Saved to demo_ds_img")
 print(ds.features)
@@ -41,31 +41,56 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-def load_llava_json(path: Path) -> List[Dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, list):
-        raise SystemExit("Expected the input JSON to be a list.")
-    return data
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import ijson  # type: ignore
+except Exception:
+    ijson = None
+
+def iter_llava_json(path: Path, max_records: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield items of the top-level list; stop after max_records items when it is > 0."""
+    if ijson is None:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise SystemExit("Expected the input JSON to be a list.")
+        yield from (data[:max_records] if max_records > 0 else data)
+        return
+
+    # Stream items so the full file (665k items for LLaVA mix) is never held in memory
+    with path.open("rb") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        if first != b"[":
+            raise SystemExit("Expected the input JSON to be a list.")
+        f.seek(0)
+        for i, item in enumerate(ijson.items(f, "item", use_float=True)):
+            if max_records > 0 and i >= max_records:
+                break
+            yield item
 
 def normalize_text(value: str) -> str:
     if value is None:
         return ""
-    s = str(value)
-    s = s.replace("<image>", "").strip()
-    # Remove a leading newline if the original value started with "<image>\n"
-    while s.startswith("\n"):
-        s = s[1:]
-    return s.strip()
+    # strip() after dropping the token also removes the "\n" that follows a leading "<image>"
+    return str(value).replace("<image>", "").strip()
 
 def abs_image_path(image_root: Path, rel_path: str) -> str:
+    # image_root is resolved once by the caller; per item this is string work only (no stat/realpath)
     p = Path(rel_path)
     if p.is_absolute():
         return str(p)
-    return str((image_root / p).resolve())
+    return os.path.normpath(os.path.join(image_root, rel_path))
 
 def make_system(system_text: str) -> Dict[str, Any]:
     return {"role": "system", "content": system_text}
@@ -90,11 +115,14 @@ def make_text_typed(role: str, text: str) -> Dict[str, Any]:
 
 def write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly; write the whole file in one call
+        path.write_bytes(b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in rows))
+        return
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")
 
 def read_image_size(image_path: str) -> Tuple[int, int]:
+    # Image.open only parses the header, so .size needs no pixel decode.
     try:
         from PIL import Image
     except Exception as e:
@@ -127,7 +155,7 @@ def build_dataset_dir(rows: List[Dict[str, Any]], out_dir: Path) -> None:
         }
     )
 
-    ds = Dataset.from_list(rows).cast(features)
+    ds = Dataset.from_list(rows, features=features)
     ds.save_to_disk(str(out_dir))
 
 def main() -> None:
@@ -149,19 +177,19 @@ def main() -> None:
     args = ap.parse_args()
 
     llava_json = Path(args.llava_json)
-    image_root = Path(args.image_root)
+    image_root = Path(args.image_root).resolve()
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    items = load_llava_json(llava_json)
-    if args.max_records and args.max_records > 0:
-        items = items[: args.max_records]
+    items = iter_llava_json(llava_json, args.max_records or 0)
 
     infer_rows: List[Dict[str, Any]] = []
     train_rows: List[Dict[str, Any]] = []
     typed_infer_rows: List[Dict[str, Any]] = []
     typed_train_rows: List[Dict[str, Any]] = []
     dataset_rows: List[Dict[str, Any]] = []
+    # (sid, img_path, prompt, answer) for dataset rows; sizes are read after the loop
+    pending_dataset: List[Tuple[str, str, str, str]] = []
 
     for it in items:
         sid = str(it.get("id", ""))
@@ -172,44 +200,48 @@ def main() -> None:
 
         img_path = abs_image_path(image_root, rel_img)
 
-        # First human and first gpt for dataset prompt/answer.
-        first_human = ""
-        first_gpt = ""
-        for turn in conv:
-            if turn.get("from") == "human" and not first_human:
-                first_human = normalize_text(turn.get("value", ""))
-            if turn.get("from") == "gpt" and not first_gpt:
-                first_gpt = normalize_text(turn.get("value", ""))
-            if first_human and first_gpt:
-                break
-
-        # infer.jsonl uses only the first human turn and no assistant turns.
-        infer_messages = [make_system(args.system_text), make_user_text(first_human)]
-        infer_rows.append({"id": sid, "messages": infer_messages})
-
-        typed_infer_messages = [make_text_typed("system", args.system_text), make_user_typed(img_path, first_human)]
-        typed_infer_rows.append({"id": sid, "messages": typed_infer_messages})
-
         # train.jsonl includes full conversation with roles mapped.
         train_messages: List[Dict[str, Any]] = [make_system(args.system_text)]
         typed_train_messages: List[Dict[str, Any]] = [make_text_typed("system", args.system_text)]
 
+        # One pass: map turns for train and pick the first non-empty human/gpt text for dataset prompt/answer.
+        first_human = ""
+        first_gpt = ""
         for t in conv:
             who = t.get("from")
             val = normalize_text(t.get("value", ""))
             if who == "human":
+                if not first_human:
+                    first_human = val
                 train_messages.append(make_user_text(val))
                 typed_train_messages.append(make_user_typed(img_path, val))
             elif who == "gpt":
+                if not first_gpt:
+                    first_gpt = val
                 train_messages.append(make_assistant_text(val))
                 typed_train_messages.append(make_text_typed("assistant", val))
 
+        # infer.jsonl uses only the first human turn and no assistant turns.
+        infer_messages = [make_system(args.system_text), make_user_text(first_human)]
+        infer_rows.append({"id": sid, "messages": infer_messages})
+
+        typed_infer_messages = [make_text_typed("system", args.system_text), make_user_typed(img_path, first_human)]
+        typed_infer_rows.append({"id": sid, "messages": typed_infer_messages})
+
         train_rows.append({"id": sid, "messages": train_messages})
         typed_train_rows.append({"id": sid, "messages": typed_train_messages})
 
-        # dataset rows
         if not args.skip_dataset_dir:
-            w, h = read_image_size(img_path)
+            pending_dataset.append((sid, img_path, first_human, first_gpt))
+
+    # dataset rows
+    if pending_dataset:
+        # Header reads are I/O-bound; read each unique image's size on a thread pool
+        unique_paths = list(dict.fromkeys(img_path for _, img_path, _, _ in pending_dataset))
+        with ThreadPoolExecutor(max_workers=min(32, len(unique_paths))) as ex:
+            sizes = dict(zip(unique_paths, ex.map(read_image_size, unique_paths)))
+        for sid, img_path, first_human, first_gpt in pending_dataset:
+            w, h = sizes[img_path]
             dataset_rows.append(
                 {
                     "id": sid,
@@ -8,3 +8,11 @@ def render(messages):
         tokenize=False, #Key point
         add_generation_prompt=True,
     )
+
+def render_many(batch):
+    # One apply_chat_template call for a list of conversations -> list of prompts
+    return tokenizer.apply_chat_template(
+        batch,
+        tokenize=False,
+        add_generation_prompt=True,
+    )
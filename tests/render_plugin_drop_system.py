@@ -4,3 +4,7 @@ tokenizer = AutoTokenizer.from_pretrained("Qwen/Qwen3-VL-8B-Instruct", trust_rem
 def render(messages):
     messages = [m for m in messages if m.get("role") != "system"]
     return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+
+def render_many(batch):
+    batch = [[m for m in messages if m.get("role") != "system"] for messages in batch]
+    return tokenizer.apply_chat_template(batch, tokenize=False, add_generation_prompt=True)
@@ -166,16 +166,14 @@ import os
 from pathlib import Path
 from datasets import Dataset, Features, Value, Image as HFImage
 from PIL import Image
-import numpy as np
 
 work = Path(os.environ["MMQLINT_ART_WORKDIR"])
 img_dir = work / "demo_images"
 img_dir.mkdir(parents=True, exist_ok=True)
 
 def save_img(name: str, w: int, h: int) -> str:
-    arr = np.zeros((h, w, 3), dtype=np.uint8)
     p = img_dir / name
-    Image.fromarray(arr).save(p)
+    Image.new("RGB", (w, h), (0, 0, 0)).save(p, optimize=False, compress_level=1)
     return str(p)
 
 features = Features({
@@ -211,7 +209,7 @@ rows_bad_none = [
         "coordinates": {"x0": 10, "y0": 10, "x1": 100},  # missing y1
     },
 ]
-ds_bad_none = Dataset.from_list(rows_bad_none).cast(features)
+ds_bad_none = Dataset.from_list(rows_bad_none, features=features)
 out_bad_none = work / "demo_ds_img_bad_none"
 ds_bad_none.save_to_disk(str(out_bad_none))
 
@@ -225,7 +223,7 @@ rows_coord_warn = [
         "coordinates": {"x0": 50, "y0": 80, "x1": 900, "y1": 950},  # out of bounds
     },
 ]
-ds_coord_warn = Dataset.from_list(rows_coord_warn).cast(features)
+ds_coord_warn = Dataset.from_list(rows_coord_warn, features=features)
 out_coord_warn = work / "demo_ds_coord_warn"
 ds_coord_warn.save_to_disk(str(out_coord_warn))
 
@@ -246,7 +244,7 @@ rows_all_ok = [
         "coordinates": {"x0": 0, "y0": 0, "x1": 511, "y1": 511},
     },
 ]
-ds_all_ok = Dataset.from_list(rows_all_ok).cast(features)
+ds_all_ok = Dataset.from_list(rows_all_ok, features=features)
 out_all_ok = work / "demo_ds_all_ok"
 ds_all_ok.save_to_disk(str(out_all_ok))
 
@@ -281,4 +279,79 @@ run_ok mmqlint check-dataset "$WORK_DIR/demo_ds_all_ok" \
   --fail-on ERROR >/dev/null
 echo "OK"
 
+# ==============================================================================
+banner "[14] JSON numerics: big ints and NaN/Infinity parse and round-trip through --fix unchanged"
+# ==============================================================================
+cat > "$WORK_DIR/numeric_edge.jsonl" <<'EOF'
+{"id": 12345678901234567890123, "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}], "score": NaN}
+{"id": -9223372036854775809, "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}], "w": Infinity}
+{"id": 98765432109876543210, "messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi."}]}
+EOF
+out="$(mmqlint check "$WORK_DIR/numeric_edge.jsonl" --mode infer \
+  --profile my-vlm --profile-file "$PROFILES_YAML" \
+  --fix --out "$WORK_DIR/numeric_edge.fixed.jsonl" --fail-on ERROR)"
+echo "$out"
+if echo "$out" | grep -q "E004_BAD_JSON"; then
+  echo "ERROR: numeric edge cases reported as invalid JSON."
+  exit 1
+fi
+run_ok python - "$WORK_DIR/numeric_edge.jsonl" "$WORK_DIR/numeric_edge.fixed.jsonl" <<'PY'
+import json, sys
+src, fixed = (open(p, encoding="utf-8").read().splitlines() for p in sys.argv[1:3])
+from mmqlint.core import _loads
+# lint/verify decoding must agree with stdlib json (sample ids come from these values)
+assert all(repr(_loads(l.encode("utf-8"))) == repr(json.loads(l)) for l in src), "lint decoding differs from stdlib json"
+want = [json.dumps(json.loads(l), ensure_ascii=False) for l in src]
+assert fixed == want, f"--fix changed numeric values:\n{fixed}\nvs\n{want}"
+PY
+echo "OK"
+
+# ==============================================================================
+banner "[15] verify-system: render_many batches give the same issues as per-line render"
+# ==============================================================================
+run_ok python - "$WORK_DIR" "$PROFILES_YAML" <<'PY'
+import json, sys
+from pathlib import Path
+from mmqlint.core import verify_system_visibility_jsonl
+from mmqlint.profiles import load_profiles
+
+work, profiles_yaml = Path(sys.argv[1]), sys.argv[2]
+# Per-line plugin drops system for "drop" samples and fails on "boom"; the batched one adds
+# render_many on top (the one batch holding "boom" raises, forcing the per-line fallback).
+render_src = """
+def render(messages):
+    if any(m.get("content") == "boom" for m in messages):
+        raise ValueError("boom")
+    drop = any(m.get("content") == "drop" for m in messages)
+    return "\\n".join(str(m.get("content")) for m in messages if not (drop and m.get("role") == "system"))
+"""
+(work / "plugin_per_line.py").write_text(render_src, encoding="utf-8")
+(work / "plugin_batched.py").write_text(render_src + f"""
+def render_many(batch):
+    with open({str(work / "render_many.calls")!r}, "a") as f:
+        f.write("call\\n")
+    return [render(messages) for messages in batch]
+""", encoding="utf-8")
+
+lines = []
+for i in range(300):
+    user = "boom" if i == 150 else ("drop" if i % 3 == 1 else "hi")
+    lines.append(json.dumps({"id": f"s{i}", "messages": [{"role": "system", "content": f"sys {i}"}, {"role": "user", "content": user}]}))
+    if i % 37 == 0:
+        lines.append("{bad json")
+    if i % 41 == 0:
+        lines.append(json.dumps({"id": f"n{i}", "messages": "x"}))
+(work / "render_batch.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+prof = load_profiles(profiles_yaml)["my-vlm"]
+kw = dict(profile_obj=prof, strict_typed=False)
+per_line = verify_system_visibility_jsonl(str(work / "render_batch.jsonl"), render_plugin_path=str(work / "plugin_per_line.py"), **kw)
+batched = verify_system_visibility_jsonl(str(work / "render_batch.jsonl"), render_plugin_path=str(work / "plugin_batched.py"), **kw)
+assert (work / "render_many.calls").exists(), "render_many was never called"
+assert batched == per_line, "batched render_many issues differ from per-line render"
+assert {i.code for i in per_line} >= {"E002_SYSTEM_NOT_VISIBLE", "E901_RENDER_PLUGIN_ERROR", "E004_BAD_JSON", "E003_SCHEMA_MISMATCH"}
+print(f"{len(per_line)} issues identical")
+PY
+echo "OK"
+
 banner "ALL DONE: doc-bug coverage tests completed"